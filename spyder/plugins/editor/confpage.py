@@ -13,6 +13,7 @@ from qtpy.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QVBoxLayout,
+    QWidget,
 )
 
 from spyder.api.config.decorators import on_conf_change
@@ -31,7 +32,19 @@ GOOGLEDOC = (
 SPHINXDOC = (
     "https://sphinx-rtd-tutorial.readthedocs.io/en/latest/docstrings.html"
 )
-DOCSTRING_SHORTCUT = CONF.get('shortcuts', 'editor/docstring')
+NUMPYDOC_URL = "<a href='{}'>Numpy</a>".format(NUMPYDOC)
+GOOGLEDOC_URL = "<a href='{}'>Google</a>".format(GOOGLEDOC)
+SPHINXDOC_URL = "<a href='{}'>Sphinx</a>".format(SPHINXDOC)
+EOL_COMBO_CHOICES = (
+    ("LF (Linux/macOS)", 'LF'),
+    ("CRLF (Windows)", 'CRLF'),
+    (_("CR (legacy Mac)"), 'CR'),
+)
+DOCSTRING_COMBO_CHOICES = (
+    ("Numpy", 'Numpydoc'),
+    ("Google", 'Googledoc'),
+    ("Sphinx", 'Sphinxdoc'),
+)
 
 
 class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
@@ -45,12 +58,40 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
         self.remove_trail_newline_box = None
         self.tabwidth_spin = None
         self.indent_char_box = None
+        self._last_format_save_state = None
 
         self.apply_callback = self.set_indent_chars
 
+    @staticmethod
+    def _fill_group(group, widgets):
+        """Lay out `widgets` vertically inside `group` in a single pass."""
+        layout = QVBoxLayout()
+        for widget in widgets:
+            layout.addWidget(widget)
+        group.setLayout(layout)
+
     def setup_page(self):
+        # Suspend repaints while the whole page is built, so it is painted
+        # once at the end instead of after every widget insertion.
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_page()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _setup_page(self):
         newcb = self.create_checkbox
 
+        # Read the options needed to set initial enabled states only once
+        # instead of hitting CONF for every widget that depends on them.
+        opts = {
+            option: self.get_option(option)
+            for option in (
+                'occurrence_highlighting',
+                'convert_eol_on_save',
+            )
+        }
+
         # ---- Display tab
         # -- Interface group
         interface_group = QGroupBox(_("Interface"))
@@ -82,12 +123,15 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
             _("Allow scrolling past file end"), 'scroll_past_end'
         )
 
-        interface_layout = QVBoxLayout()
-        interface_layout.addWidget(showtabbar_box)
-        interface_layout.addWidget(show_filename_box)
-        interface_layout.addWidget(showclassfuncdropdown_box)
-        interface_layout.addWidget(scroll_past_end_box)
-        interface_group.setLayout(interface_layout)
+        self._fill_group(
+            interface_group,
+            [
+                showtabbar_box,
+                show_filename_box,
+                showclassfuncdropdown_box,
+                scroll_past_end_box,
+            ],
+        )
 
         # -- Helpers group
         helpers_group = QGroupBox(_("Helpers"))
@@ -114,13 +158,16 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
             ),
         )
 
-        helpers_layout = QVBoxLayout()
-        helpers_layout.addWidget(showindentguides_box)
-        helpers_layout.addWidget(showcodefolding_box)
-        helpers_layout.addWidget(linenumbers_box)
-        helpers_layout.addWidget(breakpoints_box)
-        helpers_layout.addWidget(todolist_box)
-        helpers_group.setLayout(helpers_layout)
+        self._fill_group(
+            helpers_group,
+            [
+                showindentguides_box,
+                showcodefolding_box,
+                linenumbers_box,
+                breakpoints_box,
+                todolist_box,
+            ],
+        )
 
         # -- Highlight group
         highlight_group = QGroupBox(_("Highlight"))
@@ -143,18 +190,12 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
             step=100,  # 0.1 seconds
         )
 
-        occurrence_box.checkbox.toggled.connect(
-            occurrence_spin.spinbox.setEnabled
-        )
-        occurrence_box.checkbox.toggled.connect(
-            occurrence_spin.slabel.setEnabled
-        )
-        occurrence_spin.spinbox.setEnabled(
-            self.get_option('occurrence_highlighting')
-        )
-        occurrence_spin.slabel.setEnabled(
-            self.get_option('occurrence_highlighting')
-        )
+        def toggle_occurrence_widgets(checked):
+            occurrence_spin.spinbox.setEnabled(checked)
+            occurrence_spin.slabel.setEnabled(checked)
+
+        occurrence_box.checkbox.toggled.connect(toggle_occurrence_widgets)
+        toggle_occurrence_widgets(opts['occurrence_highlighting'])
 
         occurrence_glayout = QGridLayout()
         occurrence_glayout.addWidget(occurrence_box, 0, 0)
@@ -197,12 +238,15 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
             ),
         )
 
-        automatic_layout = QVBoxLayout()
-        automatic_layout.addWidget(closepar_box)
-        automatic_layout.addWidget(close_quotes_box)
-        automatic_layout.addWidget(add_colons_box)
-        automatic_layout.addWidget(autounindent_box)
-        automatic_group.setLayout(automatic_layout)
+        self._fill_group(
+            automatic_group,
+            [
+                closepar_box,
+                close_quotes_box,
+                add_colons_box,
+                autounindent_box,
+            ],
+        )
 
         # -- Trailing whitespace group
         whitespace_group = QGroupBox(_("Trailing whitespace"))
@@ -251,12 +295,15 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
         )
         self.on_format_save_state(format_on_save)
 
-        whitespace_layout = QVBoxLayout()
-        whitespace_layout.addWidget(self.removetrail_box)
-        whitespace_layout.addWidget(strip_mode_box)
-        whitespace_layout.addWidget(self.add_newline_box)
-        whitespace_layout.addWidget(self.remove_trail_newline_box)
-        whitespace_group.setLayout(whitespace_layout)
+        self._fill_group(
+            whitespace_group,
+            [
+                self.removetrail_box,
+                strip_mode_box,
+                self.add_newline_box,
+                self.remove_trail_newline_box,
+            ],
+        )
 
         # -- Identation group
         indentation_group = QGroupBox(_("Indentation"))
@@ -332,23 +379,16 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
             'convert_eol_on_save',
             default=False,
         )
-        eol_combo_choices = (
-            ("LF (Linux/macOS)", 'LF'),
-            ("CRLF (Windows)", 'CRLF'),
-            (_("CR (legacy Mac)"), 'CR'),
-        )
         convert_eol_on_save_combo = self.create_combobox(
             "",
-            eol_combo_choices,
+            EOL_COMBO_CHOICES,
             'convert_eol_on_save_to',
         )
 
         convert_eol_on_save_box.checkbox.toggled.connect(
             convert_eol_on_save_combo.setEnabled
         )
-        convert_eol_on_save_combo.setEnabled(
-            self.get_option('convert_eol_on_save')
-        )
+        convert_eol_on_save_combo.setEnabled(opts['convert_eol_on_save'])
 
         eol_on_save_layout = QHBoxLayout()
         eol_on_save_layout.addWidget(convert_eol_on_save_box)
@@ -360,6 +400,114 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
         eol_group.setLayout(eol_layout)
 
         # ---- Advanced tab
+        # Most of this page's widgets live in the Advanced tab but users
+        # rarely visit it, so its contents are built the first time the tab
+        # is selected instead of when the dialog is opened (see
+        # _build_advanced_tab).
+        self._advanced_tab = QWidget(self)
+        self._advanced_tab_built = False
+
+        advanced_layout = QVBoxLayout()
+        advanced_layout.setContentsMargins(0, 0, 0, 0)
+        self._advanced_tab.setLayout(advanced_layout)
+
+        # --- Tabs ---
+        self.create_tab(
+            _("Display"),
+            [
+                interface_group,
+                helpers_group,
+                highlight_group,
+            ],
+        )
+
+        self.create_tab(
+            _("Source code"),
+            [
+                automatic_group,
+                whitespace_group,
+                indentation_group,
+                eol_group,
+            ],
+        )
+
+        self.create_tab(_("Advanced"), self._advanced_tab)
+
+        # create_tab wraps every page in a container widget, so the tab just
+        # added can only be recognized by its index.
+        self._advanced_tab_index = self.tabs.count() - 1
+
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _on_tab_changed(self, index):
+        """Build the Advanced tab contents the first time it is shown."""
+        if not self._advanced_tab_built and index == self._advanced_tab_index:
+            self._build_advanced_tab()
+
+    def _build_advanced_tab(self):
+        """Create the Advanced tab groups and initialize them from CONF."""
+        self._advanced_tab_built = True
+
+        # Snapshot the widgets registered so far so that only the ones
+        # created below are initialized from CONF afterwards. Every dict
+        # load_from_conf iterates must be covered, even the kinds this page
+        # doesn't create yet: missing one would re-initialize its eagerly
+        # built widgets and connect has_been_modified to them twice.
+        registered = {
+            name: dict(getattr(self, name))
+            for name in (
+                'checkboxes',
+                'radiobuttons',
+                'lineedits',
+                'textedits',
+                'spinboxes',
+                'comboboxes',
+                'fontboxes',
+                'coloredits',
+                'scedits',
+            )
+        }
+
+        self.setUpdatesEnabled(False)
+        try:
+            layout = self._advanced_tab.layout()
+            for group in self._create_advanced_tab_groups():
+                layout.addWidget(group)
+
+            if self.LOAD_FROM_CONFIG:
+                self._load_deferred_widgets(registered)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _load_deferred_widgets(self, registered):
+        """
+        Initialize from CONF only the widgets registered after `registered`
+        was taken, leaving the ones load_from_conf already handled untouched.
+        """
+        all_widgets = {}
+        for name, previous in registered.items():
+            current = getattr(self, name)
+            all_widgets[name] = current
+            setattr(
+                self,
+                name,
+                {
+                    widget: info
+                    for widget, info in current.items()
+                    if widget not in previous
+                },
+            )
+
+        try:
+            self.load_from_conf()
+        finally:
+            for name, widgets in all_widgets.items():
+                setattr(self, name, widgets)
+
+    def _create_advanced_tab_groups(self):
+        """Build and return the groups shown in the Advanced tab."""
+        newcb = self.create_checkbox
+
         # -- Template group
         template_group = QGroupBox(_("Template"))
         template_button = self.create_button(
@@ -393,45 +541,33 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
 
         autosave_checkbox.checkbox.toggled.connect(autosave_spinbox.setEnabled)
 
-        autosave_layout = QVBoxLayout()
-        autosave_layout.addWidget(autosave_checkbox)
-        autosave_layout.addWidget(autosave_spinbox)
-        autosave_group.setLayout(autosave_layout)
+        self._fill_group(autosave_group, [autosave_checkbox, autosave_spinbox])
 
         # -- Docstring group
         docstring_group = QGroupBox(_("Docstring style"))
-        numpy_url = "<a href='{}'>Numpy</a>".format(NUMPYDOC)
-        googledoc_url = "<a href='{}'>Google</a>".format(GOOGLEDOC)
-        sphinx_url = "<a href='{}'>Sphinx</a>".format(SPHINXDOC)
+        docstring_shortcut = CONF.get('shortcuts', 'editor/docstring')
         docstring_label = QLabel(
             _(
                 "Select the style of docstrings ({numpy}, {google} or {sphinx}) "
                 "to generate when pressing <kbd>{shortcut}</kbd> after a "
                 "function, method or class declaration"
             ).format(
-                numpy=numpy_url,
-                google=googledoc_url,
-                sphinx=sphinx_url,
-                shortcut=DOCSTRING_SHORTCUT,
+                numpy=NUMPYDOC_URL,
+                google=GOOGLEDOC_URL,
+                sphinx=SPHINXDOC_URL,
+                shortcut=docstring_shortcut,
             ),
+            self,
         )
         docstring_label.setOpenExternalLinks(True)
         docstring_label.setWordWrap(True)
-        docstring_combo_choices = (
-            ("Numpy", 'Numpydoc'),
-            ("Google", 'Googledoc'),
-            ("Sphinx", 'Sphinxdoc'),
-        )
         docstring_combo = self.create_combobox(
             _("Style:"),
-            docstring_combo_choices,
+            DOCSTRING_COMBO_CHOICES,
             'docstring_type',
         )
 
-        docstring_layout = QVBoxLayout()
-        docstring_layout.addWidget(docstring_label)
-        docstring_layout.addWidget(docstring_combo)
-        docstring_group.setLayout(docstring_layout)
+        self._fill_group(docstring_group, [docstring_label, docstring_combo])
 
         # -- Multi-cursor group
         multicursor_group = QGroupBox(_("Multi-cursor"))
@@ -444,9 +580,7 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
             ),
         )
 
-        multicursor_layout = QVBoxLayout()
-        multicursor_layout.addWidget(multicursor_box)
-        multicursor_group.setLayout(multicursor_layout)
+        self._fill_group(multicursor_group, [multicursor_box])
 
         # -- Multi-cursor paste group
         multicursor_paste_group = QGroupBox(_("Multi-cursor paste behavior"))
@@ -477,57 +611,39 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
             multicursor_paste_group.setEnabled
         )
         multicursor_paste_group.setEnabled(
-            self.get_option("multicursor_support")
+            self.get_option('multicursor_support')
         )
 
-        multicursor_paste_layout = QVBoxLayout()
-        multicursor_paste_layout.addWidget(entire_clip_radio)
-        multicursor_paste_layout.addWidget(conditional_spread_radio)
-        multicursor_paste_layout.addWidget(always_spread_radio)
-        multicursor_paste_group.setLayout(multicursor_paste_layout)
+        self._fill_group(
+            multicursor_paste_group,
+            [
+                entire_clip_radio,
+                conditional_spread_radio,
+                always_spread_radio,
+            ],
+        )
 
         # -- Mouse shortcuts group
         mouse_shortcuts_group = QGroupBox(_("Mouse shortcuts"))
         mouse_shortcuts_button = self.create_button(
-            lambda: MouseShortcutEditor(self).exec_(),
+            self._open_mouse_shortcuts_editor,
             _("Edit mouse shortcut modifiers"),
         )
 
-        mouse_shortcuts_layout = QVBoxLayout()
-        mouse_shortcuts_layout.addWidget(mouse_shortcuts_button)
-        mouse_shortcuts_group.setLayout(mouse_shortcuts_layout)
-
-        # --- Tabs ---
-        self.create_tab(
-            _("Display"),
-            [
-                interface_group,
-                helpers_group,
-                highlight_group,
-            ],
-        )
+        self._fill_group(mouse_shortcuts_group, [mouse_shortcuts_button])
 
-        self.create_tab(
-            _("Source code"),
-            [
-                automatic_group,
-                whitespace_group,
-                indentation_group,
-                eol_group,
-            ],
-        )
+        return [
+            template_group,
+            autosave_group,
+            docstring_group,
+            multicursor_group,
+            multicursor_paste_group,
+            mouse_shortcuts_group,
+        ]
 
-        self.create_tab(
-            _("Advanced"),
-            [
-                template_group,
-                autosave_group,
-                docstring_group,
-                multicursor_group,
-                multicursor_paste_group,
-                mouse_shortcuts_group,
-            ],
-        )
+    def _open_mouse_shortcuts_editor(self):
+        """Show the dialog to edit the mouse shortcut modifiers."""
+        MouseShortcutEditor(self).exec_()
 
     @on_conf_change(
         option=('provider_configuration', 'lsp', 'values', 'format_on_save'),
@@ -547,23 +663,30 @@ class EditorConfigPage(PluginConfigPage, SpyderConfigurationObserver):
         None.
 
         """
-        options = [
+        if self.removetrail_box is None:
+            # These widgets are created together in setup_page, so none of
+            # them exists yet.
+            return
+
+        if value == self._last_format_save_state:
+            # The widgets already reflect this state.
+            return
+        self._last_format_save_state = value
+
+        tooltip = ""
+        if value:
+            tooltip = _(
+                "This option is disabled since the "
+                "<i>Autoformat files on save</i> option is active."
+            )
+
+        for option in (
             self.removetrail_box,
             self.add_newline_box,
             self.remove_trail_newline_box,
-        ]
-        for option in options:
-            if option:
-                if value:
-                    option.setToolTip(
-                        _(
-                            "This option is disabled since the "
-                            "<i>Autoformat files on save</i> option is active."
-                        )
-                    )
-                else:
-                    option.setToolTip("")
-                option.setDisabled(value)
+        ):
+            option.setToolTip(tooltip)
+            option.setDisabled(value)
 
     def set_indent_chars(self):
         """Set the indent_chars config option per the two sub-options."""
@@ -9,13 +9,13 @@ Mixin to manage editing with multiple cursors.
 """
 
 # Standard library imports
-import functools
-import itertools
+import array
 
 # Third party imports
 from qtpy.QtCore import Qt, QTimer, Slot
 from qtpy.QtGui import (
-    QColor, QFontMetrics, QPaintEvent, QPainter, QTextCursor, QKeyEvent
+    QColor, QFontMetrics, QPaintEvent, QPainter, QRegion, QTextCursor,
+    QKeyEvent
 )
 from qtpy.QtWidgets import QApplication, QMessageBox
 
@@ -25,6 +25,12 @@ from spyder.plugins.editor.api.decoration import TextDecoration
 from spyder.utils.palette import SpyderPalette
 
 
+# Bracket/quote pairs removed as a unit by intelligent backspace. A
+# module-level frozenset so each backspace tests membership in O(1) instead
+# of rebuilding and scanning a tuple per cursor.
+_BACKSPACE_BRACKET_PAIRS = frozenset(('()', '[]', '{}', "''", '""'))
+
+
 class MultiCursorMixin:
     """Mixin to manage editing with multiple cursors."""
 
@@ -53,6 +59,22 @@ class MultiCursorMixin:
         self.multi_cursor_ignore_history = False
         self._drag_cursor = None
 
+        # Cached space advances for overwrite-mode cursor painting, keyed by
+        # QFont.key() so entries stay valid across font and zoom changes.
+        self._space_advance_cache = {}
+
+        # Cached QColor pair for extra cursor selections, keyed by the
+        # palette values so it refreshes if the palette is swapped.
+        self._selection_colors_cache = (None, None)
+
+        # Reusable TextDecorations for extra cursor selections, keyed by
+        # id(cursor) of the cursor they decorate.
+        self._cursor_decoration_cache = {}
+
+        # (position, anchor) pairs from the last selection update, used to
+        # skip rebuilding the selections when nothing moved.
+        self._last_selection_signature = None
+
     def toggle_multi_cursor(self, enabled):
         """Enable/disable multi-cursor editing."""
         self.multi_cursor_enabled = enabled
@@ -143,24 +165,29 @@ class MultiCursorMixin:
         # Don't attempt to remove cursor if there's only one
         removed_cursor = False
         if self.extra_cursors:
-            same_cursor = None
-            for cursor in self.all_cursors:
-                if cursor_for_pos.position() == cursor.position():
-                    same_cursor = cursor
+            same_index = None
+            click_position = cursor_for_pos.position()
+            # Reuse the main cursor copy fetched above instead of building
+            # all_cursors, which would call textCursor() again. Capture the
+            # index during the scan so the removals below don't need an
+            # O(N) value search through the list.
+            for index, cursor in enumerate(self.extra_cursors + [old_cursor]):
+                if click_position == cursor.position():
+                    same_index = index
                     break
-            if same_cursor is not None:
+            if same_index is not None:
                 removed_cursor = True
-                if same_cursor in self.extra_cursors:
+                if same_index < len(self.extra_cursors):
                     # cursor to be removed was not primary
-                    self.extra_cursors.remove(same_cursor)
+                    del self.extra_cursors[same_index]
                 else:
                     # cursor to be removed is primary cursor
                     # pick a new primary by position
-                    new_primary = max(
-                        self.extra_cursors,
-                        key=lambda cursor: cursor.position()
+                    new_index, new_primary = max(
+                        enumerate(self.extra_cursors),
+                        key=lambda pair: pair[1].position()
                     )
-                    self.extra_cursors.remove(new_primary)
+                    del self.extra_cursors[new_index]
                     self.setTextCursor(new_primary)
 
                 # Possibly clear selection of removed cursor
@@ -186,26 +213,65 @@ class MultiCursorMixin:
             self.moveCursor(QTextCursor.MoveOperation.Down)
             self.merge_extra_cursors(True)
 
+    def _selection_colors(self):
+        """Foreground/background QColor pair for extra cursor selections."""
+        key = (SpyderPalette.COLOR_TEXT_1, SpyderPalette.COLOR_ACCENT_2)
+        cached_key, colors = self._selection_colors_cache
+        if cached_key != key:
+            colors = (QColor(key[0]), QColor(key[1]))
+            self._selection_colors_cache = (key, colors)
+
+            # Cached decorations carry the old colors, so drop them and
+            # force the next selection update through.
+            self._cursor_decoration_cache = {}
+            self._last_selection_signature = None
+        return colors
+
     def set_extra_cursor_selections(self):
+        foreground, background = self._selection_colors()
+
+        # Skip the rebuild altogether when no cursor moved since the last
+        # update; the decorations already shown are still accurate.
+        signature = tuple(
+            (cursor.position(), cursor.anchor())
+            for cursor in self.extra_cursors
+        )
+        if signature == self._last_selection_signature:
+            return
+        self._last_selection_signature = signature
+
+        # This runs after every multi-cursor movement or edit, so reuse the
+        # decorations built last time instead of reconstructing each one
+        # (TextDecoration copies the cursor, so a reused decoration only
+        # needs a fresh copy when its cursor actually moved).
+        cache = self._cursor_decoration_cache
+        new_cache = {}
         selections = []
         for cursor in self.extra_cursors:
-            extra_selection = TextDecoration(
-                cursor, draw_order=5, kind="extra_cursor_selection"
-            )
-
-            extra_selection.set_foreground(
-                QColor(SpyderPalette.COLOR_TEXT_1)
-            )
-            extra_selection.set_background(
-                QColor(SpyderPalette.COLOR_ACCENT_2)
-            )
-
+            extra_selection = cache.get(id(cursor))
+            if extra_selection is None:
+                extra_selection = TextDecoration(
+                    cursor, draw_order=5, kind="extra_cursor_selection"
+                )
+                extra_selection.set_foreground(foreground)
+                extra_selection.set_background(background)
+            elif (
+                extra_selection.cursor.position() != cursor.position()
+                or extra_selection.cursor.anchor() != cursor.anchor()
+            ):
+                extra_selection.cursor = QTextCursor(cursor)
+
+            new_cache[id(cursor)] = extra_selection
             selections.append(extra_selection)
+
+        self._cursor_decoration_cache = new_cache
         self.set_extra_selections('extra_cursor_selections', selections)
 
     def clear_extra_cursors(self):
         """Remove all extra cursors"""
         self.extra_cursors = []
+        self._cursor_decoration_cache = {}
+        self._last_selection_signature = ()
         self.set_extra_selections('extra_cursor_selections', [])
 
     @property
@@ -221,53 +287,107 @@ class MultiCursorMixin:
         previous_history = self.multi_cursor_ignore_history
         self.multi_cursor_ignore_history = True
 
-        while True:
-            cursor_was_removed = False
-
-            cursors = self.all_cursors
-            main_cursor = cursors[-1]
-            cursors.sort(key=lambda cursor: cursor.position())
-
-            for i, cursor1 in enumerate(cursors[:-1]):
-                if cursor_was_removed:
-                    break  # list will be modified, so re-start at while loop
-
-                for cursor2 in cursors[i + 1:]:
-                    # given cursors.sort, pos1 should be <= pos2
-                    pos1 = cursor1.position()
-                    pos2 = cursor2.position()
-                    anchor1 = cursor1.anchor()
-                    anchor2 = cursor2.anchor()
-
-                    if not pos1 == pos2:
-                        continue  # only merge coincident cursors
-
-                    if cursor1 is main_cursor:
-                        # swap cursors to keep main_cursor
-                        cursor1, cursor2 = cursor2, cursor1
-
-                    self.extra_cursors.remove(cursor1)
-                    cursor_was_removed = True
-
-                    # reposition cursor we're keeping
-                    positions = sorted([pos1, anchor1, anchor2])
-                    if not increasing_position:
-                        positions.reverse()
-                    cursor2.setPosition(
-                        positions[0],
-                        QTextCursor.MoveMode.MoveAnchor
-                    )
-                    cursor2.setPosition(
-                        positions[2],
-                        QTextCursor.MoveMode.KeepAnchor
-                    )
-                    if cursor2 is main_cursor:
-                        self.setTextCursor(cursor2)
-                    break
+        main_cursor = self.textCursor()
+        main_cursor_merged = False
+        cursors = self.extra_cursors + [main_cursor]
+
+        # Most calls happen after ordinary typing or movement, where no two
+        # cursors coincide, so check that in a single pass and skip the merge
+        # loop entirely. For very large cursor counts (e.g. a column of
+        # thousands of cursors) use a vectorized scan instead; NumPy is not a
+        # hard dependency of Spyder, hence the guarded import.
+        positions = array.array(
+            'q', (cursor.position() for cursor in cursors)
+        )
+        if len(cursors) >= 1000:
+            try:
+                import numpy as np
+            except ImportError:
+                no_coincidence = len(set(positions)) == len(positions)
+            else:
+                sorted_positions = np.array(positions, dtype=np.int64)
+                sorted_positions.sort()
+                no_coincidence = bool(
+                    (np.diff(sorted_positions) != 0).all()
+                )
+        else:
+            no_coincidence = len(set(positions)) == len(positions)
 
-            if not cursor_was_removed:
+        if no_coincidence:
+            # Nothing to merge.
+            self.set_extra_cursor_selections()
+            self.multi_cursor_ignore_history = previous_history
+            return
+
+        # Do the merge scan on plain integer arrays of positions and anchors,
+        # touching the QTextCursors again only to write back the survivors;
+        # position()/anchor() calls cross the Qt boundary and the scan reads
+        # each value several times. Sort by position and only compare
+        # adjacent cursors instead of checking every pair. Merging can move
+        # the kept cursor onto yet another cursor, so re-scan until no merge
+        # happens (which is rare in practice).
+        anchors = array.array('q', (cursor.anchor() for cursor in cursors))
+        main_index = len(cursors) - 1  # The main cursor was appended last
+        alive = list(range(len(cursors)))
+        while True:
+            alive.sort(key=positions.__getitem__)
+
+            merged = False
+            survivors = [alive[0]]
+            for index in alive[1:]:
+                kept = survivors[-1]
+                if positions[index] != positions[kept]:
+                    survivors.append(index)
+                    continue
+
+                # Only merge coincident cursors, keeping the main cursor if
+                # it is one of the two.
+                merged = True
+                if kept == main_index:
+                    removed = index
+                else:
+                    removed = kept
+                    kept = index
+                    survivors[-1] = index
+                if kept == main_index:
+                    main_cursor_merged = True
+
+                # Reposition the cursor we're keeping so its selection spans
+                # both previous selections.
+                span = sorted(
+                    [positions[kept], anchors[kept], anchors[removed]]
+                )
+                if not increasing_position:
+                    span.reverse()
+                anchors[kept] = span[0]
+                positions[kept] = span[2]
+
+            alive = survivors
+            if not merged:
                 break
 
+        # Write the merged spans back to the surviving cursors.
+        for index in alive:
+            cursor = cursors[index]
+            if (
+                cursor.position() != positions[index]
+                or cursor.anchor() != anchors[index]
+            ):
+                cursor.setPosition(
+                    anchors[index],
+                    QTextCursor.MoveMode.MoveAnchor
+                )
+                cursor.setPosition(
+                    positions[index],
+                    QTextCursor.MoveMode.KeepAnchor
+                )
+
+        if main_cursor_merged:
+            self.setTextCursor(main_cursor)
+        self.extra_cursors = [
+            cursors[index] for index in alive if index != main_index
+        ]
+
         self.set_extra_cursor_selections()
         self.multi_cursor_ignore_history = previous_history
 
@@ -285,7 +405,11 @@ class MultiCursorMixin:
             self.overwrite_mode = not self.overwrite_mode
             return
 
-        self.textCursor().beginEditBlock()
+        # Keep a single cursor for the edit block; begin/endEditBlock act on
+        # the document, so there's no need to fetch the widget cursor again
+        # at the end.
+        edit_cursor = self.textCursor()
+        edit_cursor.beginEditBlock()
         self.multi_cursor_ignore_history = True
 
         # Handle all signals before editing text
@@ -298,16 +422,33 @@ class MultiCursorMixin:
             cursors.append(self.textCursor())
             accepted.append(event.isAccepted())
 
+        # Collect the edited lines as a region so the repaint request after
+        # the edit block covers them explicitly and Qt can coalesce it with
+        # its own update rects instead of invalidating the whole viewport.
+        # Each rect is widened to the full viewport and grown by one line to
+        # account for reflow of the neighboring lines.
+        viewport_width = self.viewport().width()
+        line_height = self.fontMetrics().height()
+        dirty_region = QRegion()
+        for cursor in cursors:
+            rect = self.cursorRect(cursor)
+            rect.setLeft(0)
+            rect.setRight(viewport_width)
+            dirty_region += rect.adjusted(0, -line_height, 0, line_height)
+
         increasing_position = True
         new_cursors = []
         for skip, cursor in zip(accepted, cursors):
-            self.setTextCursor(cursor)
             if skip:
                 # Text folding swallows most input to prevent typing on folded
-                # lines.
-                pass
+                # lines. Nothing edits this cursor, so keep it as is and skip
+                # the round trip through the widget cursor.
+                new_cursors.append(cursor)
+                continue
+
+            self.setTextCursor(cursor)
             # ---- Handle Tab
-            elif key == Qt.Key.Key_Tab and not ctrl:  # ctrl-tab is shortcut
+            if key == Qt.Key.Key_Tab and not ctrl:  # ctrl-tab is shortcut
                 # Don't do intelligent tab with multi-cursor to skip
                 # calls to do_completion. Avoiding completions with multi
                 # cursor is much easier than solving all the edge cases.
@@ -333,7 +474,7 @@ class MultiCursorMixin:
                             self.fix_indent()
                     else:
                         cur_indent = self.get_block_indentation(
-                            self.textCursor().blockNumber())
+                            cursor.blockNumber())
                         self._handle_keypress_event(event)
 
                         # Check if we're in a comment or a string at the
@@ -371,13 +512,17 @@ class MultiCursorMixin:
                 if self.has_selected_text() or not self.intelligent_backspace:
                     self._handle_keypress_event(event)
                 else:
-                    leading_text = self.get_text('sol', 'cursor')
+                    # Slice the block text locally instead of extracting each
+                    # side with get_text, which builds and moves a temporary
+                    # cursor per call.
+                    block_text = cursor.block().text()
+                    column = cursor.positionInBlock()
+                    leading_text = block_text[:column]
+                    trailing_text = block_text[column:]
                     leading_length = len(leading_text)
                     trailing_spaces = (
                         leading_length - len(leading_text.rstrip())
                     )
-                    trailing_text = self.get_text('cursor', 'eol')
-                    matches = ('()', '[]', '{}', '\'\'', '""')
                     if (
                         not leading_text.strip() and
                         (leading_length > len(self.indent_chars))
@@ -391,7 +536,8 @@ class MultiCursorMixin:
                     elif (
                         leading_text and
                         trailing_text and
-                        (leading_text[-1] + trailing_text[0] in matches)
+                        (leading_text[-1] + trailing_text[0]
+                         in _BACKSPACE_BRACKET_PAIRS)
                     ):
                         cursor = self.textCursor()
                         cursor.movePosition(QTextCursor.PreviousCharacter)
@@ -432,8 +578,23 @@ class MultiCursorMixin:
             new_cursors.append(self.textCursor())
 
         self.extra_cursors = new_cursors[:-1]
+
+        # Skipped cursors don't pass through the widget, so make sure the
+        # widget cursor is the main (last processed) cursor before merging;
+        # merge_extra_cursors treats textCursor() as the main cursor.
+        self.setTextCursor(new_cursors[-1])
         self.merge_extra_cursors(increasing_position)
-        self.textCursor().endEditBlock()
+        edit_cursor.endEditBlock()
+
+        # Add the post-edit cursor lines and request a single repaint of the
+        # union.
+        for cursor in self.all_cursors:
+            rect = self.cursorRect(cursor)
+            rect.setLeft(0)
+            rect.setRight(viewport_width)
+            dirty_region += rect.adjusted(0, -line_height, 0, line_height)
+        self.viewport().update(dirty_region)
+
         self.multi_cursor_ignore_history = False
         self.cursorPositionChanged.emit()
         event.accept()  # TODO when to pass along keypress or not
@@ -444,16 +605,35 @@ class MultiCursorMixin:
         """
         self.cursor_blink_state = not self.cursor_blink_state
         if self.isVisible():
-            self.viewport().update()
+            # Only the cursor rectangles change on blink, so don't repaint
+            # the whole viewport.
+            width = self._cursor_paint_width() + 1
+            region = QRegion()
+            for cursor in self.all_cursors:
+                rect = self.cursorRect(cursor)
+                rect.setWidth(width)
+                region += rect
+            self.viewport().update(region)
+
+    def _cursor_paint_width(self):
+        """Width in pixels used to draw each cursor."""
+        if self.overwrite_mode:
+            # Building QFontMetrics on every paint is wasteful, so the space
+            # advance is cached per font; zooming back to a previous size
+            # hits the cache too.
+            font = self.font()
+            font_key = font.key()
+            advance = self._space_advance_cache.get(font_key)
+            if advance is None:
+                advance = QFontMetrics(font).horizontalAdvance(" ")
+                self._space_advance_cache[font_key] = advance
+            return advance
+        return self.cursor_width
 
     @Slot(QPaintEvent)
     def paint_cursors(self, event):
         """Paint all cursors"""
-        if self.overwrite_mode:
-            font = self.font()
-            cursor_width = QFontMetrics(font).horizontalAdvance(" ")
-        else:
-            cursor_width = self.cursor_width
+        cursor_width = self._cursor_paint_width()
 
         qp = QPainter()
         qp.begin(self.viewport())
@@ -483,13 +663,37 @@ class MultiCursorMixin:
 
         draw_cursor = self.cursor_blink_state and (editable or flags)
 
-        for cursor in self.all_cursors:
-            block = cursor.block()
-            if draw_cursor and block.isVisible():
-                block_top = int(self.blockBoundingGeometry(block).top())
-                offset.setY(block_top + content_offset_y)
+        if draw_cursor:
+            # Several cursors can land on the same block (e.g. a column
+            # selection within a wrapped line), so bucket them by block and
+            # do the visibility and geometry work once per block.
+            by_block = {}
+            for cursor in self.all_cursors:
+                block = cursor.block()
+                by_block.setdefault(
+                    block.blockNumber(), (block, [])
+                )[1].append(cursor)
+
+            viewport_height = self.viewport().height()
+            for block, cursors in by_block.values():
+                if not block.isVisible():
+                    continue
+
+                # Cull blocks scrolled out of the viewport; with many
+                # cursors most of them are off-screen on every paint.
+                geometry = self.blockBoundingGeometry(block)
+                block_top = int(geometry.top()) + content_offset_y
+                if (
+                    block_top > viewport_height
+                    or block_top + geometry.height() < 0
+                ):
+                    continue
+
                 layout = block.layout()
-                if layout is not None:
+                if layout is None:
+                    continue
+                offset.setY(block_top)
+                for cursor in cursors:
                     layout.drawCursor(
                         qp,
                         offset,
@@ -517,26 +721,42 @@ class MultiCursorMixin:
         """
         cursors = self.all_cursors
         cursors.sort(key=lambda cursor: cursor.position())
-        selections = []
-        for cursor in cursors:
-            text = cursor.selectedText().replace(
-                "\u2029",
-                self.get_line_separator()
+
+        # Hoist the separator out of the loop and join a generator; for a
+        # single-char separator (i.e. "\n") str.translate replaces the
+        # paragraph separators in one pass.
+        line_separator = self.get_line_separator()
+        if len(line_separator) == 1:
+            table = str.maketrans("\u2029", line_separator)
+            clip_text = line_separator.join(
+                cursor.selectedText().translate(table) for cursor in cursors
+            )
+        else:
+            clip_text = line_separator.join(
+                cursor.selectedText().replace("\u2029", line_separator)
+                for cursor in cursors
             )
-            selections.append(text)
-        clip_text = self.get_line_separator().join(selections)
         QApplication.clipboard().setText(clip_text)
 
     def multi_cursor_cut(self):
         """Multi-cursor copy then removeSelectedText"""
         self.multi_cursor_copy()
-        self.textCursor().beginEditBlock()
-        for cursor in self.all_cursors:
+        main_cursor = self.textCursor()
+        main_cursor.beginEditBlock()
+
+        # Remove from the end of the document backwards so the cursors still
+        # pending don't get repositioned by every removal.
+        cursors = sorted(
+            self.extra_cursors + [main_cursor],
+            key=lambda cursor: cursor.position(),
+            reverse=True
+        )
+        for cursor in cursors:
             cursor.removeSelectedText()
 
         # Merge direction doesn't matter here as all selections are removed
         self.merge_extra_cursors(True)
-        self.textCursor().endEditBlock()
+        main_cursor.endEditBlock()
 
     def multi_cursor_paste(self, clip_text):
         """
@@ -545,26 +765,35 @@ class MultiCursorMixin:
         """
         main_cursor = self.textCursor()
         main_cursor.beginEditBlock()
-        cursors = self.all_cursors
+        cursors = self.extra_cursors + [main_cursor]
         cursors.sort(key=lambda cursor: cursor.position())
         self.skip_rstrip = True
         self.sig_will_paste_text.emit(clip_text)
         lines = clip_text.splitlines()
-        
+
         if self.get_conf('multicursor_paste/always_full'):
-            lines = itertools.repeat(clip_text)
+            lines = [clip_text] * len(cursors)
         elif self.get_conf('multicursor_paste/conditional_spread'):
             if len(lines) != len(cursors):
-                lines = itertools.repeat(clip_text)
+                lines = [clip_text] * len(cursors)
         elif self.get_conf('multicursor_paste/always_spread'):
             if len(lines) == 1:
-                lines = itertools.repeat(lines[0])
+                lines = lines * len(cursors)
+
+        # When spreading with fewer lines than cursors, cycle the lines so
+        # no cursor is silently skipped; leftover lines are dropped.
+        if lines and len(lines) < len(cursors):
+            lines = lines * (len(cursors) // len(lines) + 1)
 
         self.multi_cursor_ignore_history = True
-        for cursor, text in zip(cursors, lines):
-            self.setTextCursor(cursor)
+        # QTextCursor.insertText edits the document directly, so there's no
+        # need to route each cursor through the widget. Insert from the end
+        # of the document backwards: each edit then lands after the cursors
+        # still pending, so Qt doesn't have to shift their positions on
+        # every insert. The line-to-cursor mapping is made in document order
+        # before reversing.
+        for cursor, text in reversed(list(zip(cursors, lines))):
             cursor.insertText(text)
-            # handle extra lines or extra cursors?
 
         self.setTextCursor(main_cursor)
         self.multi_cursor_ignore_history = False
@@ -578,49 +807,15 @@ class MultiCursorMixin:
 
     def for_each_cursor(self, method, merge_increasing=True):
         """Wrap callable to execute once for each cursor"""
-        @functools.wraps(method)
-        def wrapper():
-            self.textCursor().beginEditBlock()
-            new_cursors = []
-            self.multi_cursor_ignore_history = True
-            for cursor in self.all_cursors:
-                self.setTextCursor(cursor)
-
-                # May call setTtextCursor with modified copy
-                method()
-
-                # Get modified cursor to re-add to extra_cursors
-                new_cursors.append(self.textCursor())
-
-            # re-add extra cursors
-            self.clear_extra_cursors()
-            if self.multi_cursor_enabled:
-                self.extra_cursors = new_cursors[:-1]
-            self.setTextCursor(new_cursors[-1])
-            self.merge_extra_cursors(merge_increasing)
-            self.textCursor().endEditBlock()
-            self.multi_cursor_ignore_history = False
-            self.cursorPositionChanged.emit()
-
-        return wrapper
+        return _ForEachCursorAction(self, method, merge_increasing)
 
     def clears_extra_cursors(self, method):
         """Wrap callable to clear extra_cursors prior to calling"""
-        @functools.wraps(method)
-        def wrapper():
-            self.clear_extra_cursors()
-            method()
-
-        return wrapper
+        return _ClearsExtraCursorsAction(self, method)
 
     def restrict_single_cursor(self, method):
         """Wrap callable to only execute if there is a single cursor"""
-        @functools.wraps(method)
-        def wrapper():
-            if not self.extra_cursors:
-                method()
-
-        return wrapper
+        return _RestrictSingleCursorAction(self, method)
 
     def go_to_next_cell(self):
         """
@@ -636,3 +831,75 @@ class MultiCursorMixin:
         """
         self.clear_extra_cursors()
         super().go_to_previous_cell()
+
+
+class _CursorAction:
+    """
+    Base class for the multi-cursor action wrappers.
+
+    These are bound to editor shortcuts and actions, so they're invoked on
+    every keystroke of the wrapped kind. Plain classes with __slots__ keep
+    the per-call overhead to attribute loads instead of the closure cells a
+    decorator-style wrapper would need.
+    """
+
+    __slots__ = ('editor', 'method', '__name__')
+
+    def __init__(self, editor, method):
+        self.editor = editor
+        self.method = method
+        self.__name__ = getattr(method, '__name__', type(self).__name__)
+
+
+class _ForEachCursorAction(_CursorAction):
+    """Execute a method once for each cursor."""
+
+    __slots__ = ('merge_increasing',)
+
+    def __init__(self, editor, method, merge_increasing=True):
+        super().__init__(editor, method)
+        self.merge_increasing = merge_increasing
+
+    def __call__(self):
+        editor = self.editor
+        editor.textCursor().beginEditBlock()
+        new_cursors = []
+        editor.multi_cursor_ignore_history = True
+        for cursor in editor.all_cursors:
+            editor.setTextCursor(cursor)
+
+            # May call setTextCursor with modified copy
+            self.method()
+
+            # Get modified cursor to re-add to extra_cursors
+            new_cursors.append(editor.textCursor())
+
+        # re-add extra cursors
+        editor.clear_extra_cursors()
+        if editor.multi_cursor_enabled:
+            editor.extra_cursors = new_cursors[:-1]
+        editor.setTextCursor(new_cursors[-1])
+        editor.merge_extra_cursors(self.merge_increasing)
+        editor.textCursor().endEditBlock()
+        editor.multi_cursor_ignore_history = False
+        editor.cursorPositionChanged.emit()
+
+
+class _ClearsExtraCursorsAction(_CursorAction):
+    """Clear extra_cursors prior to executing a method."""
+
+    __slots__ = ()
+
+    def __call__(self):
+        self.editor.clear_extra_cursors()
+        self.method()
+
+
+class _RestrictSingleCursorAction(_CursorAction):
+    """Execute a method only if there is a single cursor."""
+
+    __slots__ = ()
+
+    def __call__(self):
+        if not self.editor.extra_cursors:
+            self.method()
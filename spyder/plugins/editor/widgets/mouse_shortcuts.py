@@ -7,12 +7,12 @@
 """Mouse shortcut editor dialog"""
 
 # Standard library imports
-from itertools import combinations
 import sys
 
 # Third party imports
 from qtpy.QtCore import Qt, Signal
 from qtpy.QtWidgets import (
+    QButtonGroup,
     QCheckBox,
     QDialog,
     QDialogButtonBox,
@@ -52,37 +52,34 @@ class MouseShortcutEditor(QDialog, SpyderConfigurationAccessor):
         description.setWordWrap(True)
         layout.addWidget(description)
 
-        self.scrollflag_shortcut = ShortcutSelector(
-            self,
-            _("Jump within the document in the scroll flags area"),
-            mouse_shortcuts['jump_to_position']
-        )
-        self.scrollflag_shortcut.sig_changed.connect(self.validate)
-        layout.addWidget(self.scrollflag_shortcut)
-
-        self.goto_def_shortcut = ShortcutSelector(
-            self,
-            _("Go to a code definition"),
-            mouse_shortcuts['goto_definition']
-        )
-        self.goto_def_shortcut.sig_changed.connect(self.validate)
-        layout.addWidget(self.goto_def_shortcut)
-
-        self.add_cursor_shortcut = ShortcutSelector(
-            self,
-            _("Add/remove an additional cursor"),
-            mouse_shortcuts['add_remove_cursor']
-        )
-        self.add_cursor_shortcut.sig_changed.connect(self.validate)
-        layout.addWidget(self.add_cursor_shortcut)
-
-        self.column_cursor_shortcut = ShortcutSelector(
-            self,
-            _("Add a column of cursors"),
-            mouse_shortcuts['column_cursor']
-        )
-        self.column_cursor_shortcut.sig_changed.connect(self.validate)
-        layout.addWidget(self.column_cursor_shortcut)
+        self.shortcut_selectors = []
+        for attr, text, option in (
+            (
+                'scrollflag_shortcut',
+                _("Jump within the document in the scroll flags area"),
+                'jump_to_position',
+            ),
+            (
+                'goto_def_shortcut',
+                _("Go to a code definition"),
+                'goto_definition',
+            ),
+            (
+                'add_cursor_shortcut',
+                _("Add/remove an additional cursor"),
+                'add_remove_cursor',
+            ),
+            (
+                'column_cursor_shortcut',
+                _("Add a column of cursors"),
+                'column_cursor',
+            ),
+        ):
+            selector = ShortcutSelector(self, text, mouse_shortcuts[option])
+            selector.sig_changed.connect(self.validate)
+            layout.addWidget(selector)
+            setattr(self, attr, selector)
+            self.shortcut_selectors.append(selector)
         
         buttons = (
             QDialogButtonBox.StandardButton.Apply |
@@ -105,18 +102,29 @@ class MouseShortcutEditor(QDialog, SpyderConfigurationAccessor):
         
         self.setLayout(layout)
 
+        self._modifiers_applied = False
+
+    def showEvent(self, event):
+        """Snapshot the selectors' state when the dialog is first shown."""
+        if not self._modifiers_applied:
+            self._modifiers_applied = True
+            for selector in self.shortcut_selectors:
+                selector.apply_modifiers()
+        super().showEvent(event)
+
     def apply_mouse_shortcuts(self):
         """Set new config to CONF"""
         self.set_conf('mouse_shortcuts', self.mouse_shortcuts)
-        self.scrollflag_shortcut.apply_modifiers()
-        self.goto_def_shortcut.apply_modifiers()
-        self.add_cursor_shortcut.apply_modifiers()
-        self.column_cursor_shortcut.apply_modifiers()
+        for selector in self.shortcut_selectors:
+            selector.apply_modifiers()
         self.apply_button.setEnabled(False)
 
     def accept(self):
-        """Apply new settings and close dialog."""
-        self.apply_mouse_shortcuts()
+        """Apply new settings (if there are any) and close dialog."""
+        # The Apply button is only enabled when there is something to save,
+        # so reuse it to skip a needless write to CONF.
+        if self.apply_button.isEnabled():
+            self.apply_mouse_shortcuts()
         super().accept()
 
     def validate(self):
@@ -126,31 +134,31 @@ class MouseShortcutEditor(QDialog, SpyderConfigurationAccessor):
         disabled accordingly, as well as set visibility of the warning for
         shortcut conflict.
         """
-        shortcut_selectors = (
-            self.scrollflag_shortcut,
-            self.goto_def_shortcut,
-            self.add_cursor_shortcut,
-            self.column_cursor_shortcut
-        )
-
-        for selector in shortcut_selectors:
+        for selector in self.shortcut_selectors:
             selector.warning.setVisible(False)
 
+        # A selector's modifiers fit in a small bitmask, so conflicts can be
+        # found in a single pass instead of comparing all pairs.
         conflict = False
-        for a, b in combinations(shortcut_selectors, 2):
-            if a.modifiers() and a.modifiers() == b.modifiers():
+        seen = {}
+        for selector in self.shortcut_selectors:
+            mask = selector.modifiers_mask()
+            if not mask:
+                continue
+            if mask in seen:
                 conflict = True
-                a.warning.setVisible(True)
-                b.warning.setVisible(True)
+                selector.warning.setVisible(True)
+                seen[mask].warning.setVisible(True)
+            else:
+                seen[mask] = selector
 
         self.ok_button.setEnabled(not conflict)
 
         self.apply_button.setEnabled(
-            not conflict and (
-                self.scrollflag_shortcut.is_changed() or
-                self.goto_def_shortcut.is_changed() or
-                self.add_cursor_shortcut.is_changed() or
-                self.column_cursor_shortcut.is_changed()
+            not conflict
+            and any(
+                selector.is_changed()
+                for selector in self.shortcut_selectors
             )
         )
 
@@ -173,9 +181,18 @@ class ShortcutSelector(QWidget):
     def __init__(self, parent, label, modifiers):
         super().__init__(parent)
 
+        # Lowercase once for all the substring checks below.
+        modifiers = modifiers.lower()
+
+        # Cache for the modifiers string, rebuilt lazily after each change.
+        self._cached_modifiers = None
+
+        # Last mask seen by validate, used to skip redundant validations.
+        self._last_validated_mask = None
+
         layout = QHBoxLayout()
 
-        label = QLabel(label)
+        label = QLabel(label, self)
         layout.addWidget(label)
 
         spacer = QWidget(self)
@@ -184,28 +201,42 @@ class ShortcutSelector(QWidget):
         )
         layout.addWidget(spacer)
 
+        # Create the checkboxes with their parent set from the start so Qt
+        # doesn't have to reparent them when they are added to the layout.
         self.ctrl_check = QCheckBox(
-            "Cmd" if sys.platform == "darwin" else "Ctrl"
+            "Cmd" if sys.platform == "darwin" else "Ctrl", self
         )
-        self.ctrl_check.setChecked("ctrl" in modifiers.lower())
-        self.ctrl_check.toggled.connect(self.validate)
+        self.ctrl_check.setChecked("ctrl" in modifiers)
         layout.addWidget(self.ctrl_check)
 
-        self.alt_check = QCheckBox("Alt")
-        self.alt_check.setChecked("alt" in modifiers.lower())
-        self.alt_check.toggled.connect(self.validate)
+        self.alt_check = QCheckBox("Alt", self)
+        self.alt_check.setChecked("alt" in modifiers)
         layout.addWidget(self.alt_check)
 
-        self.meta_check = QCheckBox("Meta")
-        self.meta_check.setChecked("meta" in modifiers.lower())
-        self.meta_check.toggled.connect(self.validate)
+        self.meta_check = QCheckBox("Meta", self)
+        self.meta_check.setChecked("meta" in modifiers)
         layout.addWidget(self.meta_check)
 
-        self.shift_check = QCheckBox("Shift")
-        self.shift_check.setChecked("shift" in modifiers.lower())
-        self.shift_check.toggled.connect(self.validate)
+        self.shift_check = QCheckBox("Shift", self)
+        self.shift_check.setChecked("shift" in modifiers)
         layout.addWidget(self.shift_check)
 
+        # Manage the checkboxes through a single non-exclusive button group,
+        # which needs one toggled connection for the whole selector and maps
+        # each checkbox to its bit in the modifiers mask.
+        self.modifier_group = QButtonGroup(self)
+        self.modifier_group.setExclusive(False)
+        for bit, checkbox in enumerate(
+            (
+                self.ctrl_check,
+                self.alt_check,
+                self.meta_check,
+                self.shift_check,
+            )
+        ):
+            self.modifier_group.addButton(checkbox, id=1 << bit)
+        self.modifier_group.buttonToggled.connect(self.validate)
+
         warning_icon = ima.icon("MessageBoxWarning")
         self.warning = TipWidget(
             _("Shortcut Conflicts With Another"),
@@ -220,9 +251,11 @@ class ShortcutSelector(QWidget):
         self.warning.setVisible(False)
         layout.addWidget(self.warning)
 
-        self.setLayout(layout)
+        # The initial modifiers snapshot is taken by MouseShortcutEditor when
+        # the dialog is shown, not here at construction time.
+        self.current_modifiers = None
 
-        self.apply_modifiers()
+        self.setLayout(layout)
 
     def validate(self):
         """
@@ -231,11 +264,15 @@ class ShortcutSelector(QWidget):
         checkbox accordingly. (Re)Emit a signal to MouseShortcutEditor which
         will perform other validation.
         """
-        if (
-            self.ctrl_check.isChecked() or
-            self.alt_check.isChecked() or
-            self.meta_check.isChecked()
-        ):
+        mask = self.modifiers_mask()
+        if mask == self._last_validated_mask:
+            # Nothing changed since the last validation, so don't make the
+            # editor redo its checks.
+            return
+        self._last_validated_mask = mask
+        self._cached_modifiers = None
+
+        if mask & 0b111:  # Ctrl, Alt or Meta is checked
             self.shift_check.setEnabled(True)
         else:
             self.shift_check.setEnabled(False)
@@ -243,18 +280,28 @@ class ShortcutSelector(QWidget):
 
         self.sig_changed.emit()
 
+    def modifiers_mask(self):
+        """Get the current modifiers packed as a bitmask."""
+        mask = 0
+        for checkbox in self.modifier_group.buttons():
+            if checkbox.isChecked():
+                mask |= self.modifier_group.id(checkbox)
+        return mask
+
     def modifiers(self):
         """Get the current modifiers string."""
-        modifiers = []
-        if self.ctrl_check.isChecked():
-            modifiers.append("Ctrl")
-        if self.alt_check.isChecked():
-            modifiers.append("Alt")
-        if self.meta_check.isChecked():
-            modifiers.append("Meta")
-        if self.shift_check.isChecked():
-            modifiers.append("Shift")
-        return "+".join(modifiers)
+        if self._cached_modifiers is None:
+            modifiers = []
+            if self.ctrl_check.isChecked():
+                modifiers.append("Ctrl")
+            if self.alt_check.isChecked():
+                modifiers.append("Alt")
+            if self.meta_check.isChecked():
+                modifiers.append("Meta")
+            if self.shift_check.isChecked():
+                modifiers.append("Shift")
+            self._cached_modifiers = "+".join(modifiers)
+        return self._cached_modifiers
 
     def is_changed(self):
         """Is the current selection different from when last applied?"""
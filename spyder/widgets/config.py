@@ -102,6 +102,10 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
     CONF_SECTION = None
     LOAD_FROM_CONFIG = True
 
+    # OS-dependent margin subtracted from MAX_WIDTH when sizing the widgets
+    # added to tabs, precomputed once instead of per widget in create_tab.
+    TAB_WIDGET_MARGIN = 60 if MAC else (80 if WIN else 70)
+
     def __init__(self, parent):
         SidebarPage.__init__(self, parent)
 
@@ -1180,12 +1184,11 @@ class SpyderConfigPage(SidebarPage, ConfigAccessMixin):
         # total height of the page is too large.
         layout.setSizeConstraint(QLayout.SetFixedSize)
 
+        # We need to set a min width so that pages are not shown too thin
+        # due to setting the layout size constraint above.
+        min_width = self.MAX_WIDTH - self.TAB_WIDGET_MARGIN
         for w in widgets:
-            # We need to set a min width so that pages are not shown too thin
-            # due to setting the layout size constraint above.
-            w.setMinimumWidth(
-                self.MAX_WIDTH - (60 if MAC else (80 if WIN else 70))
-            )
+            w.setMinimumWidth(min_width)
             layout.addWidget(w)
 
         layout.addStretch(1)
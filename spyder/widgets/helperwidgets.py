@@ -690,8 +690,9 @@ class TipWidget(QLabel):
     ):
         super().__init__()
 
-        if wrap_text:
-            tip_text = '\n'.join(textwrap.wrap(tip_text, 50))
+        # Wrapping is deferred to show_tip so that pages with many tips
+        # don't pay for text layout that may never be displayed.
+        self._wrap_text = wrap_text
         self.tip_text = tip_text
 
         size = size if size is not None else AppStyle.ConfigPageIconSize
@@ -710,6 +711,9 @@ class TipWidget(QLabel):
 
     def show_tip(self):
         """Show tooltip"""
+        if self._wrap_text:
+            self._wrap_text = False
+            self.tip_text = '\n'.join(textwrap.wrap(self.tip_text, 50))
         if not QToolTip.isVisible():
             QToolTip.showText(
                 self.mapToGlobal(QPoint(self.width(), 15)),